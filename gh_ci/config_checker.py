@@ -1,5 +1,7 @@
 #!/usr/bin/env python3.9
 import argparse
+import asyncio
+import functools
 import logging
 import os.path
 
@@ -12,6 +14,11 @@ from aiohttp import (
 )
 from syncer import sync
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 from yaml_snippets.data_models import (
     MirrorData,
     MainConfig,
@@ -24,6 +31,9 @@ from yaml_snippets.utils import (
     load_json_schema,
 )
 
+# the max number of mirrors which are checked at the same time
+MAX_CONCURRENT_MIRRORS_CHECKS = 16
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(
     level=logging.INFO,
@@ -31,6 +41,11 @@ logging.basicConfig(
 )
 
 
+@functools.lru_cache(maxsize=None)
+def get_json_schema(path: str) -> dict:
+    return load_json_schema(path=path)
+
+
 class YamlFileType(argparse.FileType):
 
     def __call__(self, string):
@@ -38,7 +53,7 @@ class YamlFileType(argparse.FileType):
         try:
             return {
                 'config_path': file_stream.name,
-                'config_data': yaml.safe_load(file_stream),
+                'config_data': yaml.load(file_stream, Loader=YamlLoader),
             }
         except yaml.YAMLError as err:
             raise argparse.ArgumentTypeError(
@@ -60,7 +75,7 @@ def create_parser():
         dest='service_config',
         help='Path to a service yaml config. Default path is ./config.yml.',
         required=True,
-        type=YamlFileType('r'),
+        type=YamlFileType('rb'),
     )
     parser.add_argument(
         '-mc',
@@ -69,7 +84,7 @@ def create_parser():
         help='A list of paths to a checked mirror config',
         default=[],
         nargs='+',
-        type=YamlFileType('r'),
+        type=YamlFileType('rb'),
     )
     return parser
 
@@ -78,22 +93,47 @@ async def are_mirrors_available(
         mirrors: list[MirrorData],
         main_config: MainConfig,
 ) -> int:
-    ret_code = 0
-    conn = TCPConnector(limit=10000, force_close=True)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_MIRRORS_CHECKS)
+
+    async def _is_mirror_available(
+            mirror: MirrorData,
+            http_session: ClientSession,
+    ) -> bool:
+        async with semaphore:
+            return await mirror_available(
+                mirror_info=mirror,
+                http_session=http_session,
+                logger=logger,
+                main_config=main_config,
+            )
+
+    conn = TCPConnector(
+        limit=10000,
+        ttl_dns_cache=300,
+        force_close=True,
+    )
     async with ClientSession(
             connector=conn,
             headers={"Connection": "close"}
     ) as http_session:
-        for mirror in mirrors:
-            is_available = await mirror_available(
-                mirror_info=mirror,
+        results = await asyncio.gather(*(
+            _is_mirror_available(
+                mirror=mirror,
                 http_session=http_session,
-                logger=logger,
-                main_config=main_config,
+            ) for mirror in mirrors
+        ), return_exceptions=True)
+    ret_code = 0
+    for mirror, is_available in zip(mirrors, results):
+        if isinstance(is_available, BaseException):
+            logger.error(
+                'Cannot check availability of mirror "%s" because "%s"',
+                mirror.name,
+                is_available,
             )
-            # True is 1, False is 0, so
-            # we get 1 if a mirror is not available
-            ret_code += int(not is_available)
+            is_available = False
+        # True is 1, False is 0, so
+        # we get 1 if a mirror is not available
+        ret_code += int(not is_available)
     return ret_code
 
 
@@ -153,7 +193,7 @@ def main(args):
         'gh_ci/yaml_snippets/json_schemas/service_config',
         f'v{service_config_version}.json',
     )
-    json_schema = load_json_schema(path=json_schema_path)
+    json_schema = get_json_schema(path=json_schema_path)
     is_validity, err = config_validation(
         yaml_data=service_config_data,
         json_schema=json_schema,
@@ -185,7 +225,7 @@ def main(args):
             'gh_ci/yaml_snippets/json_schemas/mirror_config',
             f'v{mirror_config_version}.json',
         )
-        json_schema = load_json_schema(path=json_schema_path)
+        json_schema = get_json_schema(path=json_schema_path)
         is_validity, err = config_validation(
             yaml_data=mirror_config_data,
             json_schema=json_schema,
@@ -212,9 +252,6 @@ def main(args):
         )
         for mirror_config in args.mirror_configs
     ]
-    main_config, err_msg = process_main_config(
-        yaml_data=args.service_config['config_data'],
-    )
     exit_code += do_mirrors_have_valid_geo_data(
         mirrors=mirrors,
     )